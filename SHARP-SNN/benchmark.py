@@ -0,0 +1,71 @@
+import os
+import io
+import time
+import contextlib
+import numpy as np
+from network import SharpSNN
+
+def run_network(n_threads, n_in, n_hidden, n_backup, time_steps, repeats):
+    """Runs a seeded network; returns (timings, mean firing rate, output spikes, final weights)."""
+    # Same seed for every thread count so each run does identical work
+    np.random.seed(0)
+    # ~0.5 input spikes per step keeps hidden firing inside the detector's healthy band
+    # (0.005-0.2); unscaled input drives every neuron to fire on every step
+    input_data = np.random.rand(n_in) / n_in
+    outputs = []
+    total_time = 0.0
+    heal_time = 0.0
+
+    with SharpSNN(n_in, n_hidden, 2, n_backup, n_threads=n_threads) as snn:
+        snn.encoder.method = "Rate" # Real input spikes, so STDP and LIF do actual work
+
+        # Time the serial healing pass separately from the sharded part of each step
+        check_and_heal = snn._check_and_heal
+        def timed_check_and_heal():
+            nonlocal heal_time
+            start = time.perf_counter()
+            check_and_heal()
+            heal_time += time.perf_counter() - start
+        snn._check_and_heal = timed_check_and_heal
+
+        with contextlib.redirect_stdout(io.StringIO()): # Silence healing logs
+            # Warm-up run, then inject faults so healing and recovery are exercised too
+            outputs.append(snn.forward(input_data, time_steps=time_steps, learn=True))
+            snn.neurons[0].inject_fault("Dead")
+            snn.neurons[1].inject_fault("Silent")
+            snn.neurons[2].inject_fault("Hyperactive")
+
+            heal_time = 0.0
+            for _ in range(repeats):
+                start = time.perf_counter()
+                outputs.append(snn.forward(input_data, time_steps=time_steps, learn=True))
+                total_time += time.perf_counter() - start
+        weights = snn.input_synapses.weights.copy()
+        rate = np.mean([out[:, snn.active_neuron_ids].mean() for out in outputs[1:]])
+
+    steps = time_steps * repeats
+    return (total_time / steps, heal_time / steps), rate, np.array(outputs), weights
+
+def run_benchmark(n_in=256, n_hidden=20000, n_backup=20, time_steps=50, repeats=3):
+    print("=== SHARP-SNN Intra-Step Scaling Benchmark ===")
+    print(f"Inputs={n_in}, Hidden={n_hidden} (+{n_backup} backups), {time_steps} steps x {repeats} runs")
+
+    max_threads = os.cpu_count() or 1
+    print(f"Cores available: {max_threads}")
+    print("  threads   step ms   shard ms   heal ms (serial)   firing rate   speedup")
+    baseline = None
+
+    for n_threads in range(1, max_threads + 1):
+        (step, heal), rate, outputs, weights = run_network(n_threads, n_in, n_hidden, n_backup, time_steps, repeats)
+
+        if baseline is None:
+            baseline = (step, outputs, weights)
+        else:
+            # Sharding must not change results: compare against the 1-thread run
+            assert np.array_equal(outputs, baseline[1]), f"threads={n_threads}: output spikes differ from 1 thread"
+            assert np.array_equal(weights, baseline[2]), f"threads={n_threads}: weights differ from 1 thread"
+        print(f"  {n_threads:<7d} {step * 1000:9.2f} {(step - heal) * 1000:10.2f} {heal * 1000:18.2f} "
+              f"{rate:13.4f}   x{baseline[0] / step:.2f}")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,4 +1,4 @@
-from collections import deque
+import numpy as np
 
 class FaultType:
     HEALTHY="HEALTHY"
@@ -7,31 +7,67 @@ class FaultType:
     DEAD="DEAD"
 
 class FaultDetector:
-    def __init__(self,window_size=150): # Increased from 50 to 150 (slower, more stable detection)
+    def __init__(self,window_size=150,n_neurons=0): # Increased from 50 to 150 (slower, more stable detection)
         self.window_size=window_size
-        self.spike_history={}
+        # Per-neuron ring buffer of the last `window_size` spikes, plus a running total
+        # so detect_fault() is O(1) and record_spikes() is one vectorised write
+        self.history=np.zeros((n_neurons,window_size),dtype=np.int8)
+        self.heads=np.zeros(n_neurons,dtype=int)
+        self.counts=np.zeros(n_neurons,dtype=int)
+        self.totals=np.zeros(n_neurons,dtype=int)
+
+    def _ensure_capacity(self,n_neurons):
+        extra=n_neurons-len(self.counts)
+        if extra>0:
+            self.history=np.vstack([self.history,np.zeros((extra,self.window_size),dtype=np.int8)])
+            self.heads=np.concatenate([self.heads,np.zeros(extra,dtype=int)])
+            self.counts=np.concatenate([self.counts,np.zeros(extra,dtype=int)])
+            self.totals=np.concatenate([self.totals,np.zeros(extra,dtype=int)])
 
     def record_spike(self,neuron_id,spiked):
-        if neuron_id not in self.spike_history:
-            self.spike_history[neuron_id]=deque(maxlen=self.window_size)
-        self.spike_history[neuron_id].append(spiked)
+        self.record_spikes(np.array([neuron_id]),np.array([spiked]))
+
+    def record_spikes(self,neuron_ids,spikes):
+        '''Records one timestep for several (distinct) neurons at once'''
+        if len(neuron_ids)==0:
+            return
+        self._ensure_capacity(neuron_ids.max()+1)
+        spikes=np.asarray(spikes,dtype=np.int8)
+        heads=self.heads[neuron_ids]
+        # Slots not yet filled are zero, so this also works before the window is full
+        self.totals[neuron_ids]+=spikes-self.history[neuron_ids,heads]
+        self.history[neuron_ids,heads]=spikes
+        self.heads[neuron_ids]=(heads+1)%self.window_size
+        self.counts[neuron_ids]=np.minimum(self.counts[neuron_ids]+1,self.window_size)
 
     def clear_history(self, neuron_id):
-        if neuron_id in self.spike_history:
-            del self.spike_history[neuron_id]
+        if neuron_id < len(self.counts):
+            self.history[neuron_id]=0
+            self.heads[neuron_id]=0
+            self.counts[neuron_id]=0
+            self.totals[neuron_id]=0
 
     def detect_fault(self,neuron):
         if not neuron.is_active:
             return FaultType.DEAD
-        history = self.spike_history.get(neuron.id,[])
-        if len(history)<self.window_size:
+        if neuron.id>=len(self.counts) or self.counts[neuron.id]<self.window_size:
             return FaultType.HEALTHY 
 
-        spike_rate=sum(history)/len(history)
+        spike_rate=self.totals[neuron.id]/self.window_size
 
         if spike_rate<0.005:
             return FaultType.SILENT
         elif spike_rate>0.2:
             return FaultType.HYPERACTIVE
         else:
-            return FaultType.HEALTHY
\ No newline at end of file
+            return FaultType.HEALTHY
+
+    def detect_faults(self,neuron_ids,is_active):
+        '''Vectorised detect_fault for many neurons; returns an array of FaultType values'''
+        faults=np.full(len(neuron_ids),FaultType.HEALTHY,dtype=object)
+        full=self.counts[neuron_ids]>=self.window_size
+        spike_rate=self.totals[neuron_ids]/self.window_size
+        faults[full&(spike_rate<0.005)]=FaultType.SILENT
+        faults[full&(spike_rate>0.2)]=FaultType.HYPERACTIVE
+        faults[~is_active]=FaultType.DEAD
+        return faults
@@ -1,7 +1,39 @@
 import numpy as np
+class LIFPopulation:
+    '''Holds LIF neuron state as arrays so a slice of neurons can be stepped in one go'''
+    def __init__(self,n_neurons,threshold=1.0,decay=0.9,reset_potential=0.0):
+        self.potential=np.zeros(n_neurons)
+        self.threshold=np.full(n_neurons,threshold,dtype=float)
+        self.decay=np.full(n_neurons,decay,dtype=float)
+        self.reset_potential=np.full(n_neurons,reset_potential,dtype=float)
+        self.is_active=np.ones(n_neurons,dtype=bool)
+
+    def step(self,ids,weighted_input):
+        '''Vectorised LIFNeuron.step for neurons `ids`; returns 0/1 spikes aligned with ids'''
+        spikes=np.zeros(len(ids))
+        live=self.is_active[ids] # Dead neurons neither integrate nor fire
+        ids=ids[live]
+
+        # Integrate: Decay previous potential and add new input
+        potential=self.potential[ids]*self.decay[ids]+weighted_input[live]
+
+        # Fire: Check if potential exceeds threshold
+        fired=potential>=self.threshold[ids]
+        potential[fired]=self.reset_potential[ids][fired]
+        self.potential[ids]=potential
+        spikes[live]=fired
+        return spikes
+
 class LIFNeuron:
-    def __init__(self,neuron_id,threshold=1.0,decay=0.9,reset_potential=0.0):
+    def __init__(self,neuron_id,threshold=1.0,decay=0.9,reset_potential=0.0,population=None):
         self.id=neuron_id
+        # State lives in a LIFPopulation (shared with the network, or a private one of size 1)
+        if population is None:
+            population=LIFPopulation(1)
+            self._idx=0
+        else:
+            self._idx=neuron_id
+        self.population=population
         self.threshold=threshold
         self.decay=decay
         self.reset_potential=reset_potential
@@ -10,6 +42,47 @@ class LIFNeuron:
         self.is_active = True
 
         self.original_threshold=threshold
+
+    @property
+    def potential(self):
+        return float(self.population.potential[self._idx])
+
+    @potential.setter
+    def potential(self,value):
+        self.population.potential[self._idx]=value
+
+    @property
+    def threshold(self):
+        return float(self.population.threshold[self._idx])
+
+    @threshold.setter
+    def threshold(self,value):
+        self.population.threshold[self._idx]=value
+
+    @property
+    def decay(self):
+        return float(self.population.decay[self._idx])
+
+    @decay.setter
+    def decay(self,value):
+        self.population.decay[self._idx]=value
+
+    @property
+    def reset_potential(self):
+        return float(self.population.reset_potential[self._idx])
+
+    @reset_potential.setter
+    def reset_potential(self,value):
+        self.population.reset_potential[self._idx]=value
+
+    @property
+    def is_active(self):
+        return bool(self.population.is_active[self._idx])
+
+    @is_active.setter
+    def is_active(self,value):
+        self.population.is_active[self._idx]=value
+
     def step(self,weighted_input,current_time):
         if not self.is_active:
             return 0 # Dead neuron
@@ -1,5 +1,6 @@
 import numpy as np
-from lif_neuron import LIFNeuron
+from concurrent.futures import ThreadPoolExecutor
+from lif_neuron import LIFNeuron, LIFPopulation
 from synapse import SynapseLayer
 from spike_encoder import SpikeEncoder
 from fault_detector import FaultDetector, FaultType
@@ -7,13 +8,14 @@ from health_monitor import HealthMonitor
 from recovery_engine import RecoveryEngine
 
 class SharpSNN:
-    def __init__(self, n_in, n_hidden, n_out, n_backup=2):
+    def __init__(self, n_in, n_hidden, n_out, n_backup=2, n_threads=1):
         self.n_in = n_in
         self.n_hidden = n_hidden
         self.n_backup = n_backup
 
-        # Layers
-        self.neurons = [LIFNeuron(i) for i in range(n_hidden+n_backup)]
+        # Layers (neuron state is backed by one LIFPopulation so shards can step it vectorised)
+        self.population = LIFPopulation(n_hidden+n_backup)
+        self.neurons = [LIFNeuron(i, population=self.population) for i in range(n_hidden+n_backup)]
 
         # Initialize Backups as inactive
         for i in range(n_hidden, n_hidden+n_backup):
@@ -25,11 +27,32 @@ class SharpSNN:
 
         # Components
         self.encoder = SpikeEncoder()
-        self.fault_detector = FaultDetector()
+        self.fault_detector = FaultDetector(n_neurons=n_hidden+n_backup)
         self.health_monitor = HealthMonitor(range(n_hidden+n_backup))
         self.recovery_engine = RecoveryEngine(self)
         self.redistribution_counts = {} # Track "scar tissue"
 
+        # Intra-step parallelism: neurons (and their weight columns) are split
+        # into contiguous shards, one per thread. NumPy releases the GIL in the
+        # matmul/STDP kernels, so shards can overlap on multiple cores.
+        n_total = n_hidden + n_backup
+        self.n_threads = max(1, min(n_threads, n_total))
+        self.shard_bounds = np.linspace(0, n_total, self.n_threads + 1).astype(int)
+        self.shards = list(zip(self.shard_bounds[:-1], self.shard_bounds[1:]))
+        self._pool = ThreadPoolExecutor(max_workers=self.n_threads) if self.n_threads > 1 else None
+
+    def close(self):
+        """Shuts down the shard thread pool (if any)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def get_neuron(self, nid):
         return self.neurons[nid]
 
@@ -46,24 +69,21 @@ class SharpSNN:
         output_spikes=[]
 
         for t in range(time_steps):
-            # 1. Input -> Hidden
             in_spike=spikes[t]
-            hidden_input= self.input_synapses.forward(in_spike)
-
             current_hidden_spikes = np.zeros(len(self.neurons))
-
-            # 2. Hidden Layer Update
-            for nid in self.active_neuron_ids:
-                neuron=self.neurons[nid]
-                spike=neuron.step(hidden_input[nid],t)
-                current_hidden_spikes[nid]=spike
-                
-                # 3. Fault Monitoring
-                self.fault_detector.record_spike(nid,spike)
-
-            # 4. Learning (STDP)
-            if learn: 
-                self.input_synapses.update_stdp(in_spike, current_hidden_spikes,t)
+            shard_ids = self._split_active_ids()
+
+            if self._pool is None:
+                self._step_shard(in_spike, current_hidden_spikes, t, learn, 0, len(self.neurons), shard_ids[0])
+            else:
+                # Pre-synaptic spike times are shared by every shard, so record them once up front
+                if learn:
+                    self.input_synapses.record_pre_spikes(in_spike, t)
+                futures = [self._pool.submit(self._step_shard, in_spike, current_hidden_spikes, t, learn, lo, hi, ids, False)
+                           for (lo, hi), ids in zip(self.shards, shard_ids)]
+                # Barrier: every shard finishes timestep t before healing runs
+                for f in futures:
+                    f.result()
 
             # 5. Check Health and Heal
             self._check_and_heal() 
@@ -75,8 +95,44 @@ class SharpSNN:
             
         return np.array(output_spikes)
 
+    def _split_active_ids(self):
+        """Buckets the active neuron ids by shard (one pass, done once per timestep)."""
+        ids = np.sort(np.asarray(self.active_neuron_ids, dtype=int))
+        owner = np.searchsorted(self.shard_bounds, ids, side='right') - 1
+        cuts = np.searchsorted(owner, np.arange(1, self.n_threads))
+        return np.split(ids, cuts)
+
+    def _step_shard(self, in_spike, current_hidden_spikes, t, learn, lo, hi, ids, record_pre=True):
+        """Runs one timestep for neurons [lo, hi). Only touches that slice of state."""
+        # 1. Input -> Hidden
+        hidden_input = self.input_synapses.forward(in_spike, lo, hi)
+
+        # 2. Hidden Layer Update
+        spikes = self.population.step(ids, hidden_input[ids-lo])
+        current_hidden_spikes[ids] = spikes
+        for nid in ids[spikes > 0].tolist():
+            self.neurons[nid].spike_history.append(t)
+
+        # 3. Fault Monitoring
+        self.fault_detector.record_spikes(ids, spikes)
+
+        # 4. Learning (STDP)
+        if learn:
+            if record_pre:
+                self.input_synapses.record_pre_spikes(in_spike, t)
+            self.input_synapses.update_stdp_columns(in_spike, current_hidden_spikes, t, lo, hi)
+
     def _check_and_heal(self):
+        # Neurons that are healthy, at full health and not healing are a no-op below,
+        # so find them with one vectorised scan instead of walking them in Python
+        ids = np.asarray(self.active_neuron_ids, dtype=int)
+        faults = self.fault_detector.detect_faults(ids, self.population.is_active[ids])
+        degraded = {nid for nid, score in self.health_monitor.health_scores.items() if score < 1.0}
+        calm = set(ids[faults == FaultType.HEALTHY].tolist()) - degraded - self.health_monitor.healing_progress.keys()
+
         for nid in self.active_neuron_ids:
+            if nid in calm:
+                continue
 
             # 1. Detect
             fault = self.fault_detector.detect_fault(self.neurons[nid])
@@ -15,8 +15,10 @@ n_in = 10
 n_hidden = 5
 n_out = 2
 n_backup = 2
-snn = SharpSNN(n_in, n_hidden, n_out, n_backup)
+n_threads = 1 # >1 shards the hidden layer across a thread pool
+snn = SharpSNN(n_in, n_hidden, n_out, n_backup, n_threads)
 
+snn_lock = threading.Lock() # Held while stepping so a reset never closes a pool mid-forward
 simulation_running = False
 simulation_speed = 0.1 # seconds per step
 
@@ -33,10 +35,11 @@ def simulation_thread():
             # Note: The original forward runs for 'time_steps'. 
             # Ideally we'd modify forward to run 1 step or just call internal update 
             # But let's just run short bursts
-            snn.forward(input_data, time_steps=5, learn=True)
+            with snn_lock:
+                snn.forward(input_data, time_steps=5, learn=True)
             
-            # Emit state
-            state = snn.get_state()
+                # Emit state
+                state = snn.get_state()
             socketio.emit('snn_update', state)
             
             step += 1
@@ -55,7 +58,9 @@ def index():
 @socketio.on('connect')
 def handle_connect():
     print('Client connected')
-    emit('snn_update', snn.get_state())
+    with snn_lock:
+        state = snn.get_state()
+    emit('snn_update', state)
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -69,25 +74,29 @@ def handle_toggle(data):
 
 @socketio.on('inject_fault')
 def handle_fault(data):
-    neuron_id = data['id']
-    fault_type = data['type'] # "Dead", "Silent", "Hyperactive"
-    print(f"Injecting {fault_type} fault into Neuron {neuron_id}")
-    
-    # Inject fault
-    if 0 <= neuron_id < len(snn.neurons):
-        snn.neurons[neuron_id].inject_fault(fault_type)
+    # Hold the lock throughout so shards never see a half-applied fault and a reset can't swap snn underneath us
+    with snn_lock:
+        neuron_id = data['id']
+        fault_type = data['type'] # "Dead", "Silent", "Hyperactive"
+        print(f"Injecting {fault_type} fault into Neuron {neuron_id}")
         
-        # Force immediate health update so UI reflects it even if paused
-        detected_fault = snn.fault_detector.detect_fault(snn.neurons[neuron_id])
-        snn.health_monitor.update_health(neuron_id, detected_fault)
-        
-        socketio.emit('log_message', {'msg': f"Injected {fault_type} fault into Neuron {neuron_id}"})
-        socketio.emit('snn_update', snn.get_state())
+        # Inject fault
+        if 0 <= neuron_id < len(snn.neurons):
+            snn.neurons[neuron_id].inject_fault(fault_type)
+            
+            # Force immediate health update so UI reflects it even if paused
+            detected_fault = snn.fault_detector.detect_fault(snn.neurons[neuron_id])
+            snn.health_monitor.update_health(neuron_id, detected_fault)
+            
+            socketio.emit('log_message', {'msg': f"Injected {fault_type} fault into Neuron {neuron_id}"})
+            socketio.emit('snn_update', snn.get_state())
 
 @socketio.on('reset_network')
 def handle_reset():
     global snn
-    snn = SharpSNN(n_in, n_hidden, n_out, n_backup)
+    with snn_lock:
+        snn.close() # Release the old network's shard threads
+        snn = SharpSNN(n_in, n_hidden, n_out, n_backup, n_threads)
     socketio.emit('log_message', {'msg': "Network Reset"})
 
 if __name__ == '__main__':
@@ -13,38 +13,49 @@ class SynapseLayer:
         self.pre_spike_times=np.full(n_pre,-np.inf)
         self.post_spike_times=np.full(n_post,-np.inf)
 
-    def forward(self,pre_spikes):
-        '''Computes input to post-neurons: w*x'''
-        return np.dot(pre_spikes,self.weights)
+    def forward(self,pre_spikes,lo=0,hi=None):
+        '''Computes input to post-neurons: w*x (optionally for columns [lo,hi) only)'''
+        if hi is None:
+            hi=self.n_post
+        return np.dot(pre_spikes,self.weights[:,lo:hi])
     
     def update_stdp(self,pre_spikes,post_spikes,current_time):
         '''Applies Spike-Timing Dependent Plasticity rule'''
-        # Update spike times
+        self.record_pre_spikes(pre_spikes,current_time)
+        self.update_stdp_columns(pre_spikes,post_spikes,current_time,0,self.n_post)
+
+    def record_pre_spikes(self,pre_spikes,current_time):
+        '''Updates pre-synaptic spike times (shared by all column shards)'''
         pre_indices=np.where(pre_spikes>0)[0]
-        post_indices=np.where(post_spikes>0)[0]
         self.pre_spike_times[pre_indices]=current_time
+
+    def update_stdp_columns(self,pre_spikes,post_spikes,current_time,lo,hi):
+        '''Applies STDP to weight columns [lo,hi) only.
+
+        Touches nothing outside those columns, so disjoint shards can run
+        in parallel. Call record_pre_spikes() for this timestep first.
+        '''
+        pre_indices=np.where(pre_spikes>0)[0]
+        post_indices=lo+np.where(post_spikes[lo:hi]>0)[0]
         self.post_spike_times[post_indices]=current_time
 
         # LTP: Pre spiked BEFORE Post (Casual)
         # Check all pre that spiked recently against current post spikes
-        for post_idx in post_indices:
-            dt=current_time-self.pre_spike_times
-            # Only consider casual events within reasonable window
-            valid_mask=(dt>0)&(dt<4*self.tau)
-            # Weight change: dw = lr * exp(-dt/tau)
-            dw = self.lr * np.exp(-dt[valid_mask] / self.tau)
-            self.weights[valid_mask,post_idx]+=dw
+        dt=current_time-self.pre_spike_times
+        # Only consider casual events within reasonable window
+        valid_mask=(dt>0)&(dt<4*self.tau)
+        # Weight change: dw = lr * exp(-dt/tau)
+        dw = self.lr * np.exp(-dt[valid_mask] / self.tau)
+        self.weights[np.ix_(np.where(valid_mask)[0],post_indices)]+=dw[:,None]
             
         # LTD: Post spiked BEFORE Pre (Acasual)
         # Check all post that spiked recently against current pre spikes
-        for pre_idx in pre_indices:
-            dt=self.post_spike_times-current_time
-            dt_vals=self.post_spike_times-current_time
-            valid_mask=(dt_vals<0)&(dt_vals>-4*self.tau)
-
-            # Weight change: dw=-lr*exp(dt/tau)
-            dw=-self.lr*np.exp(dt_vals[valid_mask]/self.tau)
-            self.weights[pre_idx,valid_mask]+=dw
+        weights=self.weights[:,lo:hi]
+        dt_vals=self.post_spike_times[lo:hi]-current_time
+        valid_mask=(dt_vals<0)&(dt_vals>-4*self.tau)
+        # Weight change: dw=-lr*exp(dt/tau)
+        dw=-self.lr*np.exp(dt_vals[valid_mask]/self.tau)
+        weights[np.ix_(pre_indices,np.where(valid_mask)[0])]+=dw[None,:]
 
-        # Clip weights to prevent explosion
-        self.weights=np.clip(self.weights,0.0,1.0)
\ No newline at end of file
+        # Clip weights to prevent explosion (in place, so other shards' columns are untouched)
+        np.clip(weights,0.0,1.0,out=weights)